@@ -1595,11 +1595,9 @@ class Controller(IController):
                                for document in documents]
         merged_sentences = merged_document.get_text().split(separator)
 
-        for index, merged_sentence in enumerate(merged_sentences):
-            sentences = [document_sentences[index]
-                         for document_sentences in documents_sentences]
-            self._tag_manager.find_equivalent_tags(
-                sentences=sentences, common_sentence=merged_sentence, documents_tags=documents_tags, merged_tags=merged_document_tags)
+        self._tag_manager.find_equivalent_tags_in_documents(
+            documents_sentences=documents_sentences, merged_sentences=merged_sentences,
+            documents_tags=documents_tags, merged_tags=merged_document_tags)
     #! END DEPRECATED
 
     @with_highlight_update
@@ -1,4 +1,5 @@
-from typing import Dict, List, Tuple
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
 from model.document_model import DocumentModel
 from model.interfaces import IAnnotableDocumentModel, ITagModel
 # from test_data.json.timex3_example_2 import doc
@@ -13,6 +14,10 @@ class AnnotationDocumentModel(DocumentModel, IAnnotableDocumentModel):
         super().__init__(document_data)
         self._tags: List[ITagModel] = []
         # self._meta_tags: List[ITagModel] = []
+        self._mutation_depth: int = 0
+        # Lookup tables from tag IDs and UUIDs to tags, built on demand
+        self._tags_by_id: Optional[Dict[str, ITagModel]] = None
+        self._tags_by_uuid: Optional[Dict[str, ITagModel]] = None
 
     def get_tags(self) -> list:
         """
@@ -31,8 +36,89 @@ class AnnotationDocumentModel(DocumentModel, IAnnotableDocumentModel):
             tags (list): A list of tags represented as ITagModel objects to set.
         """
         self._tags = tags
+        self._reset_tag_indices()
         self.notify_observers()
 
+    def get_tag_by_id(self, tag_id: str) -> Optional[ITagModel]:
+        """
+        Retrieves the tag with the given ID.
+
+        The lookup table is built on the first call and reused until the tags change.
+        If several tags share an ID, the first one in the document is returned.
+
+        Args:
+            tag_id (str): The ID of the tag.
+
+        Returns:
+            Optional[ITagModel]: The tag with the given ID, or None if no such tag exists.
+        """
+        if self._mutation_depth:
+            # The tags may still change, so the lookup table must not be cached
+            return next((tag for tag in self._tags if tag.get_id() == tag_id), None)
+
+        if self._tags_by_id is None:
+            self._tags_by_id = {}
+            for tag in self._tags:
+                self._tags_by_id.setdefault(tag.get_id(), tag)
+        return self._tags_by_id.get(tag_id)
+
+    def get_tag_by_uuid(self, tag_uuid: str) -> Optional[ITagModel]:
+        """
+        Retrieves the tag with the given UUID.
+
+        The lookup table is built on the first call and reused until the tags change.
+
+        Args:
+            tag_uuid (str): The UUID of the tag.
+
+        Returns:
+            Optional[ITagModel]: The tag with the given UUID, or None if no such tag exists.
+        """
+        if self._mutation_depth:
+            # The tags may still change, so the lookup table must not be cached
+            return next((tag for tag in self._tags if tag.get_uuid() == tag_uuid), None)
+
+        if self._tags_by_uuid is None:
+            self._tags_by_uuid = {}
+            for tag in self._tags:
+                self._tags_by_uuid.setdefault(tag.get_uuid(), tag)
+        return self._tags_by_uuid.get(tag_uuid)
+
+    def _reset_tag_indices(self) -> None:
+        """
+        Discards the tag lookup tables so they are rebuilt on the next lookup.
+        """
+        self._tags_by_id = None
+        self._tags_by_uuid = None
+
+    @contextmanager
+    def mutate_tags(self) -> Iterator[List[ITagModel]]:
+        """
+        Provides the live tag list for in-place modification.
+
+        Observer notifications are suppressed while the context is active and
+        a single notification is sent when the outermost context exits. Nested
+        contexts share the same list.
+
+        Yields:
+            List[ITagModel]: The live tag list of the document.
+        """
+        self._mutation_depth += 1
+        self._reset_tag_indices()
+        try:
+            yield self._tags
+        finally:
+            self._mutation_depth -= 1
+            if not self._mutation_depth:
+                self.notify_observers()
+
+    def notify_observers(self) -> None:
+        """
+        Notifies observers unless a tag mutation is currently in progress.
+        """
+        if not self._mutation_depth:
+            super().notify_observers()
+
     def get_state(self) -> dict:
         """
         Retrieves a dictionary representation of the object's attributes.
@@ -1,4 +1,4 @@
-from typing import List, Optional, Tuple
+from typing import ContextManager, List, Optional, Tuple
 from typing import Dict, List, Tuple, Union
 from model.highlight_model import HighlightModel
 from model.interfaces import IComparisonModel, IDocumentModel, ITagModel
@@ -364,6 +364,45 @@ class ComparisonModel(IComparisonModel):
         """
         self._document_models[0].set_tags(tags)
 
+    def get_tag_by_id(self, tag_id: str) -> Optional[ITagModel]:
+        """
+        Retrieves the tag with the given ID from the base document model.
+
+        This method delegates to the first document in the list.
+
+        Args:
+            tag_id (str): The ID of the tag.
+
+        Returns:
+            Optional[ITagModel]: The tag with the given ID, or None if no such tag exists.
+        """
+        return self._document_models[0].get_tag_by_id(tag_id)
+
+    def get_tag_by_uuid(self, tag_uuid: str) -> Optional[ITagModel]:
+        """
+        Retrieves the tag with the given UUID from the base document model.
+
+        This method delegates to the first document in the list.
+
+        Args:
+            tag_uuid (str): The UUID of the tag.
+
+        Returns:
+            Optional[ITagModel]: The tag with the given UUID, or None if no such tag exists.
+        """
+        return self._document_models[0].get_tag_by_uuid(tag_uuid)
+
+    def mutate_tags(self) -> ContextManager[List[ITagModel]]:
+        """
+        Provides the live tag list of the base document model for in-place modification.
+
+        This method delegates to the first document in the list.
+
+        Returns:
+            ContextManager[List[ITagModel]]: A context manager yielding the live tag list.
+        """
+        return self._document_models[0].mutate_tags()
+
     def get_common_text(self) -> List[str]:
         """
         Returns the full list of raw sentences from the merged document.
@@ -1,11 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List,  Union
+from typing import ContextManager, Dict, List, Optional, Union
 from data_classes.search_result import SearchResult
 from observer.interfaces import IObserver, IPublisher
 
 
 class ITagModel(ABC):
-    pass
+    __slots__ = ()
 
 
 class IDocumentModel(IPublisher):
@@ -129,6 +129,44 @@ class IAnnotableDocumentModel(IDocumentModel):
         """
         pass
 
+    @abstractmethod
+    def get_tag_by_id(self, tag_id: str) -> Optional[ITagModel]:
+        """
+        Retrieves the tag with the given ID.
+
+        Args:
+            tag_id (str): The ID of the tag.
+
+        Returns:
+            Optional[ITagModel]: The tag with the given ID, or None if no such tag exists.
+        """
+        pass
+
+    @abstractmethod
+    def get_tag_by_uuid(self, tag_uuid: str) -> Optional[ITagModel]:
+        """
+        Retrieves the tag with the given UUID.
+
+        Args:
+            tag_uuid (str): The UUID of the tag.
+
+        Returns:
+            Optional[ITagModel]: The tag with the given UUID, or None if no such tag exists.
+        """
+        pass
+
+    @abstractmethod
+    def mutate_tags(self) -> ContextManager[List[ITagModel]]:
+        """
+        Provides the live tag list for in-place modification.
+
+        Observers are notified once when the outermost context exits.
+
+        Returns:
+            ContextManager[List[ITagModel]]: A context manager yielding the live tag list.
+        """
+        pass
+
 
 class IComparisonModel(IPublisher):
     """
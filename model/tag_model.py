@@ -12,8 +12,13 @@ class TagModel(ITagModel):
 
     Attributes:
         _tag_data (Dict[str, Any]): A dictionary containing all tag-related data.
+        _incoming_references_count (int): The number of tags referencing this tag.
+        _tag_string (Optional[str]): The cached string representation of the tag, or None
+            if it has to be rebuilt.
     """
 
+    __slots__ = ("_tag_data", "_incoming_references_count", "_tag_string")
+
     def __init__(self, tag_data: Dict[str, Any]):
         """
         Initializes a TagModel instance using a dictionary containing all necessary data.
@@ -32,6 +37,7 @@ class TagModel(ITagModel):
         self._tag_data = tag_data
         self._tag_data["tag_hash"] = self._compute_hash()
         self._incoming_references_count = 0
+        self._tag_string = None
 
     def _compute_hash(self) -> str:
         """
@@ -107,6 +113,9 @@ class TagModel(ITagModel):
         """
         Retrieves attributes based on the provided keys or returns all attributes.
 
+        The returned dictionary must not be modified directly. Use `set_attributes`
+        or `set_id` instead, so that the cached string representation stays valid.
+
         Args:
             keys (Optional[List[str]]): A list of attribute keys to retrieve.
                                         If None, all attributes are returned.
@@ -126,6 +135,7 @@ class TagModel(ITagModel):
         """
         self._tag_data["attributes"].update(
             {key: value for key, value in new_attributes})
+        self._tag_string = None
 
     def get_tag_type(self) -> str:
         """
@@ -144,6 +154,7 @@ class TagModel(ITagModel):
             tag_type (str): The new tag type to set.
         """
         self._tag_data["tag_type"] = tag_type
+        self._tag_string = None
 
     def get_position(self) -> int:
         """
@@ -180,6 +191,7 @@ class TagModel(ITagModel):
             text (str): The new text to associate with the tag.
         """
         self._tag_data["text"] = text
+        self._tag_string = None
 
     def get_id(self) -> str:
         """
@@ -198,6 +210,7 @@ class TagModel(ITagModel):
             new_id (str): The new ID to set for the tag.
         """
         self._tag_data["attributes"]["id"] = new_id
+        self._tag_string = None
 
     def get_id_name(self) -> str:
         """
@@ -216,6 +229,7 @@ class TagModel(ITagModel):
             new_id_name (str): The new ID attribute name.
         """
         self._tag_data["id_name"] = new_id_name
+        self._tag_string = None
 
     def get_references(self) -> Dict[str, ITagModel]:
         """
@@ -320,23 +334,28 @@ class TagModel(ITagModel):
         Returns a string representation of the tag as it would appear in the text.
 
         The string includes the tag type, all attributes, and the associated text.
+        It is cached until the tag type, attributes, ID, ID name, or text change.
 
         Returns:
             str: A string representation of the tag in the format:
                 <tag_type attr1="value1" attr2="value2">text</tag_type>
         """
+        if self._tag_string is not None:
+            return self._tag_string
+
         attributes = self._tag_data.get("attributes", {})
         attributes_str = ""
         if "id" in attributes:
             attributes_str = f'{self._tag_data["id_name"]}="{attributes["id"]}"'
-            other_attrs = " ".join(
+            other_attrs = " ".join([
                 f'{key}="{value}"' for key, value in attributes.items() if key != "id"
-            )
+            ])
             if other_attrs:
                 attributes_str += " " + other_attrs
         else:
-            attributes_str = " ".join(
+            attributes_str = " ".join([
                 f'{key}="{value}"' for key, value in attributes.items()
-            )
+            ])
 
-        return f'<{self._tag_data["tag_type"]} {attributes_str}>{self._tag_data["text"]}</{self._tag_data["tag_type"]}>'
+        self._tag_string = f'<{self._tag_data["tag_type"]} {attributes_str}>{self._tag_data["text"]}</{self._tag_data["tag_type"]}>'
+        return self._tag_string
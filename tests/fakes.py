@@ -0,0 +1,13 @@
+from typing import List
+
+
+class FakeController:
+    """
+    Provides the tag type configuration that the TagManager and TagProcessor query from the controller.
+    """
+
+    def get_id_name(self, tag_type: str) -> str:
+        return {"EVENT": "eid", "TIMEX": "tid"}.get(tag_type, "")
+
+    def get_id_refs(self, tag_type: str) -> List[str]:
+        return {"TIMEX": ["anchor"]}.get(tag_type, [])
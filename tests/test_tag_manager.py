@@ -0,0 +1,59 @@
+import unittest
+
+from model.annotation_document_model import AnnotationDocumentModel
+from tests.fakes import FakeController
+from utils.tag_manager import TagManager
+from utils.tag_processor import TagProcessor
+
+
+class TestFindEquivalentTagsInDocuments(unittest.TestCase):
+    def setUp(self):
+        controller = FakeController()
+        self.tag_manager = TagManager(controller, TagProcessor(controller))
+
+    def _create_document(self, text: str) -> AnnotationDocumentModel:
+        document = AnnotationDocumentModel({"text": text})
+        self.tag_manager.extract_tags_from_document(document)
+        return document
+
+    def _find_equivalent_tags(self, documents, merged_document) -> None:
+        # Mirrors the way the controller splits the documents into sentences
+        self.tag_manager.find_equivalent_tags_in_documents(
+            documents_sentences=[document.get_text().split("\n\n")
+                                 for document in documents],
+            merged_sentences=merged_document.get_text().split("\n\n"),
+            documents_tags=[document.get_tags() for document in documents],
+            merged_tags=merged_document.get_tags())
+
+    def test_tag_spanning_the_separator_is_ignored(self):
+        text = 'Hello <EVENT eid="e1">world\n\nSecond</EVENT> today.'
+        documents = [self._create_document(text), self._create_document(text)]
+        merged_document = self._create_document("Hello world\n\nSecond today.")
+
+        self._find_equivalent_tags(documents, merged_document)
+
+        for document in documents:
+            self.assertNotIn("equivalent_uuids",
+                             document.get_tags()[0].get_tag_data())
+
+    def test_matching_tags_become_equivalent(self):
+        documents = [
+            self._create_document(
+                'A <EVENT eid="e1">walk</EVENT>.\n\nOn <TIMEX tid="t1">Monday</TIMEX>.'),
+            self._create_document(
+                'A <EVENT eid="e1">walk</EVENT>.\n\nOn Monday.')
+        ]
+        merged_document = self._create_document("A walk.\n\nOn Monday.")
+
+        self._find_equivalent_tags(documents, merged_document)
+
+        first_event, second_event = (document.get_tags()[0] for document in documents)
+        expected_uuids = [first_event.get_uuid(), second_event.get_uuid()]
+        self.assertEqual(first_event.get_tag_data()["equivalent_uuids"], expected_uuids)
+        self.assertEqual(second_event.get_tag_data()["equivalent_uuids"], expected_uuids)
+        timex = documents[0].get_tags()[1]
+        self.assertEqual(timex.get_tag_data()["equivalent_uuids"], [timex.get_uuid()])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+
+from tests.fakes import FakeController
+from utils.tag_processor import TagProcessor
+
+
+class TestGetUntaggedTagPositions(unittest.TestCase):
+    def setUp(self):
+        self.tag_processor = TagProcessor(FakeController())
+
+    def assert_matches_stripped_prefix(self, text: str) -> None:
+        # The untagged position equals the length of the stripped text preceding the tag
+        expected = {
+            tag["position"]: len(self.tag_processor.delete_all_tags_from_text(
+                text[:tag["position"]]))
+            for tag in self.tag_processor.extract_tags_from_text(text)
+        }
+        self.assertEqual(
+            self.tag_processor.get_untagged_tag_positions(text), expected)
+
+    def test_tag_at_start(self):
+        text = '<EVENT eid="e1">Rain</EVENT> fell.'
+
+        self.assertEqual(self.tag_processor.get_untagged_tag_positions(text), {0: 0})
+        self.assert_matches_stripped_prefix(text)
+
+    def test_tag_at_end(self):
+        text = 'It rained on <TIMEX tid="t1">Monday</TIMEX>'
+
+        self.assertEqual(self.tag_processor.get_untagged_tag_positions(text), {13: 13})
+        self.assert_matches_stripped_prefix(text)
+
+    def test_nested_tags(self):
+        text = 'A <EVENT eid="e1">walk on <TIMEX tid="t1">Monday</TIMEX></EVENT> and <EVENT eid="e2">rain</EVENT>.'
+
+        # Like delete_all_tags_from_text, only the outermost tags are removed
+        self.assertEqual(
+            self.tag_processor.get_untagged_tag_positions(text), {2: 2, 69: 45})
+        self.assert_matches_stripped_prefix(text)
+
+    def test_adjacent_tags(self):
+        text = '<EVENT eid="e1">a</EVENT><EVENT eid="e2">b</EVENT> <TIMEX tid="t1">c</TIMEX>'
+
+        self.assertEqual(
+            self.tag_processor.get_untagged_tag_positions(text), {0: 0, 25: 1, 51: 3})
+        self.assert_matches_stripped_prefix(text)
+
+
+class TestExtractTagsFromSentences(unittest.TestCase):
+    def setUp(self):
+        self.tag_processor = TagProcessor(FakeController())
+
+    def test_matches_extraction_per_sentence(self):
+        sentences = [
+            'A <EVENT eid="e1">walk</EVENT> at <TIMEX tid="t1" anchor="t2">noon</TIMEX>.',
+            "No tags here.",
+            '<TIMEX tid="t2">Monday</TIMEX> and <EVENT eid="e2">rain</EVENT>'
+        ]
+
+        self.assertEqual(
+            self.tag_processor.extract_tags_from_sentences(sentences),
+            [self.tag_processor.extract_tags_from_text(sentence) for sentence in sentences])
+
+    def test_ignores_tag_spanning_the_separator(self):
+        sentences = 'Hello <EVENT eid="e1">world\n\nSecond</EVENT> today.'.split("\n\n")
+
+        self.assertEqual(
+            self.tag_processor.extract_tags_from_sentences(sentences), [[], []])
+
+    def test_finds_tag_following_an_unclosed_tag(self):
+        sentences = ['<EVENT eid="e1">open', 'Then <EVENT eid="e2">rain</EVENT></EVENT>']
+
+        tags_sentences = self.tag_processor.extract_tags_from_sentences(sentences)
+
+        self.assertEqual(tags_sentences[0], [])
+        self.assertEqual([tag["attributes"]["id"] for tag in tags_sentences[1]], ["e2"])
+        self.assertEqual(tags_sentences[1][0]["position"], 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -128,6 +128,22 @@ class ITagProcessor(ABC):
         """
         pass
 
+    @abstractmethod
+    def update_tags(self, text: str, tags: List[ITagModel]) -> str:
+        """
+        Replaces several tags in the text with their current string representations.
+
+        All replacements are applied in a single left-to-right walk over the text.
+
+        Args:
+            text (str): The document text containing the tags.
+            tags (List[ITagModel]): The updated tags, sorted by position.
+
+        Returns:
+            str: The updated text with the modified tags.
+        """
+        pass
+
     @abstractmethod
     def extract_tags_from_text(self, text: str) -> List[Dict]:
         """
@@ -140,3 +156,30 @@ class ITagProcessor(ABC):
             List[Dict]: A list of extracted tag dictionaries.
         """
         pass
+
+    @abstractmethod
+    def get_untagged_tag_positions(self, text: str) -> Dict[int, int]:
+        """
+        Maps the start position of each tag in the text to its position in the untagged text.
+
+        Args:
+            text (str): The input text containing tags.
+
+        Returns:
+            Dict[int, int]: A dictionary mapping tag start positions in the text to the
+                corresponding positions after all tags have been removed.
+        """
+        pass
+
+    @abstractmethod
+    def extract_tags_from_sentences(self, sentences: List[str]) -> List[List[Dict]]:
+        """
+        Extracts tag information from several sentences, each scanned on its own.
+
+        Args:
+            sentences (List[str]): The sentences containing tags.
+
+        Returns:
+            List[List[Dict]]: One list of extracted tag dictionaries per sentence.
+        """
+        pass
@@ -1,12 +1,19 @@
-from hashlib import md5
+from bisect import bisect_left, insort
+from hashlib import blake2b
+import itertools
+from operator import methodcaller
 import re
 from typing import Dict, List, Tuple, Union
-import uuid
 from controller.interfaces import IController
 from model.interfaces import IDocumentModel, ITagModel
 from model.tag_model import TagModel
 from utils.interfaces import ITagProcessor
 
+# Splits an ID such as "t12" into its prefix and its number
+_ID_PREFIX_PATTERN = re.compile(r"([a-zA-Z]+)(\d+)")
+# Sort key of the position-ordered tag lists
+_POSITION_KEY = methodcaller("get_position")
+
 
 class TagManager:
     """
@@ -29,6 +36,8 @@ class TagManager:
         """
         self._tag_processor: ITagProcessor = tag_processor
         self._controller: IController = controller
+        # Source of the UUIDs assigned to tags during this session
+        self._uuid_counter = itertools.count(1)
 
     def extract_tags_from_document(self, target_model: IDocumentModel) -> None:
         """
@@ -50,32 +59,31 @@ class TagManager:
         extracted_tag_data = self._tag_processor.extract_tags_from_text(
             document_text)
 
-        tags = []
-        # Convert each tag_data dictionary into a TagModel object
+        # Assign a unique UUID to each tag_data
         for tag_data in extracted_tag_data:
-            # Assign a unique UUID to the tag_data
-            tag_uuid = self._generate_unique_id()
-            tag_data["uuid"] = tag_uuid
-
-            # Create a TagModel instance using the tag_data
-            tag = TagModel(tag_data)
+            tag_data["uuid"] = self._generate_unique_id()
 
-            # Add the TagModel to the internal list
-            tags.append(tag)
+        # Convert each tag_data dictionary into a TagModel object
+        tags = [TagModel(tag_data) for tag_data in extracted_tag_data]
 
-        # Ensure the tags are sorted by position
-        tags.sort(key=lambda tag: tag.get_position())
+        # The processor scans the text left to right, so the tags are already sorted by position
+        assert all(previous.get_position() <= tag.get_position()
+                   for previous, tag in zip(tags, tags[1:]))
 
         target_model.set_tags(tags)
 
     def _generate_unique_id(self) -> str:
         """
-        Generates a globally unique identifier (UUID).
+        Generates a unique identifier (UUID) for a tag.
+
+        The UUIDs are only used to identify tags within the running application and
+        are never saved, so they are drawn from a counter instead of a random source.
+        The counter is formatted as 32 hex digits, the same form as `uuid.UUID.hex`.
 
         Returns:
             str: The newly generated unique ID as a string.
         """
-        return str(uuid.uuid4())
+        return format(next(self._uuid_counter), "032x")
 
     def add_tag(self, tag_data: Dict, target_model: IDocumentModel) -> str:
         """
@@ -95,33 +103,28 @@ class TagManager:
         # Generate a unique UUID for the tag
         tag_data.setdefault("uuid", self._generate_unique_id())
 
-        # Set references to the referred objects
-        tag_data["references"] = self._resolve_references(
-            references=tag_data["references"], target_model=target_model)
+        with target_model.mutate_tags() as tags:
+            # Set references to the referred objects
+            tag_data["references"] = self._resolve_references(
+                references=tag_data["references"], tags=tags)
 
-        new_tag = TagModel(tag_data)
-        tags = target_model.get_tags()
-        for index, tag in enumerate(tags):
-            if new_tag.get_position() < tag.get_position():
-                tags.insert(index, new_tag)
-                break
-        else:
-            tags.append(new_tag)
-        target_model.set_tags(tags)
+            # Insert the tag behind all tags at the same or a lower position
+            new_tag = TagModel(tag_data)
+            insort(tags, new_tag, key=_POSITION_KEY)
 
-        text = target_model.get_text()
+            text = target_model.get_text()
 
-        # Insert the new tag into the text
-        updated_text = self._tag_processor.insert_tag_into_text(text, new_tag)
-        offset = len(str(new_tag))-len(str(new_tag.get_text()))
-        self._update_positions(
-            start_position=new_tag.get_position(), offset=offset, target_model=target_model)
-        # Update IDs and adjust text
-        updated_text = self._update_ids(
-            new_tag=new_tag, target_model=target_model, text=updated_text)
+            # Insert the new tag into the text
+            updated_text = self._tag_processor.insert_tag_into_text(
+                text, new_tag)
+            offset = len(str(new_tag))-len(new_tag.get_text())
+            # Shift subsequent tags, update IDs and adjust text
+            updated_text = self._update_ids(
+                new_tag=new_tag, tags=tags, text=updated_text,
+                start_position=new_tag.get_position(), shift=offset)
 
-        # Apply final text update after all modifications
-        target_model.set_text(updated_text)
+            # Apply final text update after all modifications
+            target_model.set_text(updated_text)
 
         return tag_data["uuid"]
 
@@ -143,8 +146,18 @@ class TagManager:
         """
 
         tag_data.setdefault("uuid", tag_uuid)
-        self.delete_tag(tag_uuid=tag_uuid, target_model=target_model)
-        self.add_tag(tag_data=tag_data, target_model=target_model)
+        tag = self._get_tag(tag_uuid, target_model)
+        with target_model.mutate_tags() as tags:
+            if (tag_data["position"] == tag.get_position()
+                    and tag_data["text"] == tag.get_text()
+                    and tag_data["tag_type"] == tag.get_tag_type()):
+                # Only the attributes change, so the tag can be replaced where it is
+                self._replace_tag(tag=tag, tag_data=tag_data,
+                                  tags=tags, target_model=target_model)
+            else:
+                self._remove_tag(tag=tag, tags=tags,
+                                 target_model=target_model)
+                self.add_tag(tag_data=tag_data, target_model=target_model)
         return
 
     def delete_tag(self, tag_uuid: str, target_model: IDocumentModel) -> None:
@@ -161,124 +174,195 @@ class TagManager:
         Raises:
             ValueError: If the tag with the given UUID does not exist.
         """
-        # Get tags from current model
-        tags = target_model.get_tags()
-        for index, tag in enumerate(tags):
-            if tag.get_uuid() == tag_uuid:
-                for _, reference in tag.get_references().items():
-                    reference.decrement_reference_count()
-                del tags[index]
-                target_model.set_tags(tags)
+        tag = self._get_tag(tag_uuid, target_model)
+        with target_model.mutate_tags() as tags:
+            self._remove_tag(tag=tag, tags=tags, target_model=target_model)
 
-                # Get the current document text
-                text = target_model.get_text()
+    def _remove_tag(self, tag: ITagModel, tags: List[ITagModel], target_model: IDocumentModel) -> None:
+        """
+        Removes the given tag from the tag list and the document text.
 
-                # Remove the tag from the text
-                text = self._tag_processor.delete_tag_from_text(tag, text)
+        Args:
+            tag (ITagModel): The tag to be removed.
+            tags (List[ITagModel]): The live tag list of the document, updated in place.
+            target_model (IDocumentModel): The document model containing the tag.
+        """
+        for _, reference in tag.get_references().items():
+            reference.decrement_reference_count()
+
+        del tags[self._get_tag_index(tag, tags)]
 
-                # Update positions of subsequent tags
-                offset = len(str(tag.get_text()))-len(str(tag))
+        # Get the current document text
+        text = target_model.get_text()
 
-                self._update_positions(
-                    start_position=tag.get_position(), offset=offset, target_model=target_model)
+        # Remove the tag from the text
+        text = self._tag_processor.delete_tag_from_text(tag, text)
+
+        # Update positions of subsequent tags
+        offset = len(tag.get_text())-len(str(tag))
+
+        # Shift subsequent tags, update IDs and adjust text
+        text = self._update_ids(new_tag=tag, text=text, tags=tags,
+                                start_position=tag.get_position(), shift=offset)
+
+        # Apply final text update after all modifications
+        target_model.set_text(text)
+
+    def _replace_tag(self, tag: ITagModel, tag_data: Dict, tags: List[ITagModel], target_model: IDocumentModel) -> None:
+        """
+        Replaces the given tag with a new tag at the same position in the tag list and the document text.
 
-                # Update IDs and adjust text
-                text = self._update_ids(
-                    new_tag=tag, text=text, target_model=target_model)
+        The new tag must have the same type, position and text as the replaced tag, so
+        it keeps its place in the tag list and only the IDs and the positions of the
+        subsequent tags need to be updated.
+
+        Args:
+            tag (ITagModel): The tag to be replaced.
+            tag_data (Dict): The data of the new tag.
+            tags (List[ITagModel]): The live tag list of the document, updated in place.
+            target_model (IDocumentModel): The document model containing the tag.
+        """
+        for _, reference in tag.get_references().items():
+            reference.decrement_reference_count()
+
+        # Set references to the referred objects
+        tag_data["references"] = self._resolve_references(
+            references=tag_data["references"], tags=tags)
+
+        new_tag = TagModel(tag_data)
+        tags[self._get_tag_index(tag, tags)] = new_tag
+
+        # Replace the tag in the text
+        text = self._tag_processor.delete_tag_from_text(
+            tag, target_model.get_text())
+        text = self._tag_processor.insert_tag_into_text(text, new_tag)
+        offset = len(str(new_tag))-len(str(tag))
+
+        # Shift subsequent tags, update IDs and adjust text
+        text = self._update_ids(new_tag=new_tag, tags=tags, text=text,
+                                start_position=new_tag.get_position(), shift=offset)
+
+        # Apply final text update after all modifications
+        target_model.set_text(text)
+
+    def _get_tag_index(self, tag: ITagModel, tags: List[ITagModel]) -> int:
+        """
+        Locates the given tag in the position-sorted tag list.
+
+        Args:
+            tag (ITagModel): The tag to locate.
+            tags (List[ITagModel]): The tag list of the document, sorted by position.
+
+        Returns:
+            int: The index of the tag in the list.
+        """
+        # Locate the tag among the tags sharing its position
+        index = bisect_left(tags, tag.get_position(), key=_POSITION_KEY)
+        while tags[index] is not tag:
+            index += 1
+        return index
+
+    def _get_tag(self, tag_uuid: str, target_model: IDocumentModel) -> ITagModel:
+        """
+        Retrieves the tag with the given UUID from the document model.
+
+        Args:
+            tag_uuid (str): The UUID of the tag.
+            target_model (IDocumentModel): The document model containing the tag.
 
-                # Apply final text update after all modifications
-                target_model.set_text(text)
-                return
+        Returns:
+            ITagModel: The tag with the given UUID.
 
-        raise ValueError(f"Tag with UUID {tag_uuid} does not exist.")
+        Raises:
+            ValueError: If the tag with the given UUID does not exist.
+        """
+        tag = target_model.get_tag_by_uuid(tag_uuid)
+        if tag is None:
+            raise ValueError(f"Tag with UUID {tag_uuid} does not exist.")
+        return tag
 
-    def _update_ids(self, new_tag: ITagModel, target_model: IDocumentModel, text: str) -> str:
+    def _update_ids(self, new_tag: ITagModel, tags: List[ITagModel], text: str, start_position: int = 0, shift: int = 0) -> str:
         """
         Updates tag IDs sequentially and adjusts positions in the text.
 
         Ensures all tags of the same type as `new_tag` are renumbered sequentially, 
         modifying the document text accordingly. Position offsets are updated 
-        dynamically to maintain text integrity.
+        dynamically to maintain text integrity. In the same pass, all tags occurring
+        after `start_position` are shifted by `shift` to account for the insertion
+        or removal of `new_tag`.
 
         Args:
             new_tag (ITagModel): The tag that triggered the ID update.
-            target_model (IDocumentModel): The document model containing the tags.
+            tags (List[ITagModel]): The live tag list of the document, updated in place.
             text (str): The document text to be updated.
+            start_position (int): The position after which tags are shifted by `shift`.
+            shift (int): The number of characters by which to shift subsequent tags.
 
         Returns:
             str: The updated document text reflecting the new tag IDs.
         """
-        # Get tags from current model
-        tags = target_model.get_tags()
         tag_type = new_tag.get_tag_type()
 
         # Udate IDs sequentially
         current_id = 1
         offset = 0
+        updated_tags = []
         for tag in tags:
-            # Adjust the position with the current offset
-            tag.set_position(tag.get_position() + offset)
+            # Shift subsequent tags and adjust the position with the current offset
+            position = tag.get_position()
+            delta = shift + offset if position > start_position else offset
+            if delta:
+                tag.set_position(position + delta)
 
             if tag.get_tag_type() == tag_type:
                 old_id = tag.get_id() or "0"  # Default to "0" if no ID exists
                 # Generate the new sequential ID
                 new_id = str(current_id)
                 # adjust prefix
-                match = re.match(r"([a-zA-Z]+)(\d+)", old_id)
+                match = _ID_PREFIX_PATTERN.match(old_id)
                 if match:
                     prefix, _ = match.groups()
                     new_id = prefix+new_id
 
-                tag.set_id(new_id)
-
-                # Notify processor about change
-                text = self._tag_processor.update_tag(text, tag)
-
-                offset += len(new_id) - len(old_id)
+                # Only tags whose ID actually changes need to be rewritten
+                if new_id != old_id:
+                    tag.set_id(new_id)
+                    updated_tags.append(tag)
+                    offset += len(new_id) - len(old_id)
                 current_id += 1
 
+        # Notify processor about all changes at once
+        text = self._tag_processor.update_tags(text, updated_tags)
+
         # Update reference IDs
         offset = 0
+        updated_tags = []
         for tag in tags:
             # update position
-            tag.set_position(tag.get_position()+offset)
+            if offset:
+                tag.set_position(tag.get_position()+offset)
             if not (references := tag.get_references()):
                 continue
             attributes = tag.get_attributes()
-            for attribute_name, old_ref_id in attributes.items():
-                if attribute_name in references:
-                    new_ref_id = references[attribute_name].get_id()
-                    attributes[attribute_name] = new_ref_id
-                    offset += len(new_ref_id)-len(old_ref_id)
-                    # Notify processor about change
-            text = self._tag_processor.update_tag(text, tag)
+            changed_references = [
+                (attribute_name, new_ref_id)
+                for attribute_name, old_ref_id in attributes.items()
+                if attribute_name in references
+                and (new_ref_id := references[attribute_name].get_id()) != old_ref_id
+            ]
+            if not changed_references:
+                continue
+            for attribute_name, new_ref_id in changed_references:
+                offset += len(new_ref_id)-len(attributes[attribute_name])
+            tag.set_attributes(changed_references)
+            updated_tags.append(tag)
 
-        target_model.set_tags(tags)
+        # Notify processor about all changes at once
+        text = self._tag_processor.update_tags(text, updated_tags)
 
         return text
 
-    def _update_positions(self, start_position: int, offset: int, target_model: IDocumentModel) -> None:
-        """
-        Adjusts the positions of tags after modifications in the document.
-
-        This method updates the position of all tags occurring after the given 
-        `start_position`, ensuring they shift appropriately based on the applied `offset`.
-
-        Args:
-            start_position (int): The position from which updates should be applied.
-            offset (int): The number of characters by which to shift subsequent tags.
-            target_model (IDocumentModel): The document model containing the tags.
-        """
-        # Get tags from current model
-        tags = target_model.get_tags()
-
-        for tag in tags:
-            tag_position = tag.get_position()
-            if tag_position > start_position:
-                tag.set_position(tag_position + offset)
-        target_model.set_tags(tags)
-
-    def _resolve_references(self, references: Dict[str, Union[str, ITagModel]], target_model: IDocumentModel) -> Dict[str, ITagModel]:
+    def _resolve_references(self, references: Dict[str, Union[str, ITagModel]], tags: List[ITagModel]) -> Dict[str, ITagModel]:
         """
         Resolves reference values in the `references` dictionary by linking them to actual TagModel objects.
 
@@ -290,30 +374,36 @@ class TagManager:
 
         Args:
             references (Dict[str, Union[str, ITagModel]]): A dictionary mapping attribute names to either tag IDs or TagModel objects.
-            target_model (IDocumentModel): The document model in which references should be resolved.
+            tags (List[ITagModel]): The tags of the document in which references should be resolved.
 
         Returns:
             Dict[str, ITagModel]: A dictionary with resolved references (attribute name to TagModel).
         """
-        tags = target_model.get_tags()
         resolved_references = {}
+        # Lookup tables are built on first use
+        tags_by_id = None
+        tag_indices_by_uuid = None
 
         for key, ref in references.items():
             if isinstance(ref, str):
-                for tag in tags:
-                    if tag.get_id() == ref:
-                        resolved_references[key] = tag
-                        tag.increment_reference_count()
-                        break
+                if tags_by_id is None:
+                    tags_by_id = self._index_tags_by_id(tags)
+                tag = tags_by_id.get(ref)
+                if tag is not None:
+                    resolved_references[key] = tag
+                    tag.increment_reference_count()
             else:
-                found = False
-                for tag in tags:
-                    if tag.get_uuid() in ref.get_equivalent_uuids():
-                        resolved_references[key] = tag
-                        tag.increment_reference_count()
-                        found = True
-                        break
-                if not found:
+                if tag_indices_by_uuid is None:
+                    tag_indices_by_uuid = {tag.get_uuid(): index
+                                           for index, tag in enumerate(tags)}
+                # Choose the first matching tag in document order
+                matching_indices = [tag_indices_by_uuid[uuid] for uuid in ref.get_equivalent_uuids()
+                                    if uuid in tag_indices_by_uuid]
+                if matching_indices:
+                    tag = tags[min(matching_indices)]
+                    resolved_references[key] = tag
+                    tag.increment_reference_count()
+                else:
                     self._comparison_model.add_unresolved_reference(ref)
                     resolved_references[key] = ref
 
@@ -337,13 +427,7 @@ class TagManager:
         Raises:
             ValueError: If no tag with the given UUID exists in the document model.
         """
-        tags = target_model.get_tags()
-
-        for tag in tags:
-            if tag.get_uuid() == uuid:
-                return tag.is_deletion_prohibited()
-
-        raise ValueError(f"Tag with UUID {uuid} does not exist.")
+        return self._get_tag(uuid, target_model).is_deletion_prohibited()
 
     def get_tag_data(self, tag_uuid: str, target_model: IDocumentModel) -> Dict:
         """
@@ -359,13 +443,7 @@ class TagManager:
         Raises:
             ValueError: If the tag with the given UUID does not exist.
         """
-        # Get tags from current model
-        tags = target_model.get_tags()
-        for tag in tags:
-            if tag.get_uuid() == tag_uuid:
-                return tag.get_tag_data()
-
-        raise ValueError(f"Tag with UUID {tag_uuid} does not exist.")
+        return self._get_tag(tag_uuid, target_model).get_tag_data()
 
     def get_highlight_data(self, target_model: IDocumentModel) -> List[Tuple[str, int, int]]:
         """
@@ -383,7 +461,8 @@ class TagManager:
                 - The second element (int) is the start position of the tag.
                 - The third element (int) is the end position of the tag.
         """
-        return [(tag.get_tag_type(), tag.get_position(), tag.get_position()+len(str(tag))) for tag in target_model.get_tags()]
+        return [(tag.get_tag_type(), (position := tag.get_position()), position + len(str(tag)))
+                for tag in target_model.get_tags()]
 
     def get_uuid_from_id(self, tag_id: str, target_model: IDocumentModel) -> str:
         """
@@ -399,11 +478,10 @@ class TagManager:
         Raises:
             ValueError: If no tag with the specified ID exists.
         """
-        tags = target_model.get_tags()
-        for tag in tags:
-            if tag.get_id() == tag_id:
-                return tag.get_uuid()
-        raise ValueError(f"No tag found with ID '{tag_id}'.")
+        tag = target_model.get_tag_by_id(tag_id)
+        if tag is None:
+            raise ValueError(f"No tag found with ID '{tag_id}'.")
+        return tag.get_uuid()
 
     def set_meta_tags(self, tag_strings: Dict[str, str], target_model: IDocumentModel) -> None:
         """
@@ -415,14 +493,11 @@ class TagManager:
             target_model (IDocumentModel): The document model to which the processed meta 
                 tags will be assigned.
         """
-        meta_tags = {}
-        for tag_type, meta_tag_strings in tag_strings.items():
-            tag_data = self._tag_processor.extract_tags_from_text(
-                meta_tag_strings)
-            tags = []
-            for tag in tag_data:
-                tags.append(TagModel(tag_data=tag))
-            meta_tags[tag_type] = tags
+        meta_tags = {
+            tag_type: [TagModel(tag_data=tag_data) for tag_data in self._tag_processor.extract_tags_from_text(
+                meta_tag_strings)]
+            for tag_type, meta_tag_strings in tag_strings.items()
+        }
 
         target_model.set_meta_tags(meta_tags)
 
@@ -456,55 +531,81 @@ class TagManager:
             tag_data["position"] += offset
             tag_data["uuid"] = self._generate_unique_id()
             tag_data["references"] = self._resolve_references(
-                tag_data.get("references", {}), target_model)
+                tag_data.get("references", {}), target_model.get_tags())
             self.add_tag(tag_data=tag_data, target_model=target_model)
 
-    def find_equivalent_tags(
+    def find_equivalent_tags_in_documents(
         self,
-        sentences: List[str],
-        common_sentence: str,
+        documents_sentences: List[List[str]],
+        merged_sentences: List[str],
         documents_tags: List[List[ITagModel]],
         merged_tags: List[ITagModel]
     ) -> None:
         """
-        Identifies and marks equivalent tags across different annotator sentence versions.
+        Identifies and marks equivalent tags across all sentences of the annotator documents.
 
-        This version supports tag dictionaries extracted from raw sentences via extract_tags_from_text,
-        and matches them to TagModel instances from document-level tag structures.
+        The tags of all sentences of a document are extracted in one call, and the ID
+        lookup tables of the documents are built only once. Afterwards, the sentence
+        versions are matched one by one.
 
         Args:
-            sentences (List[str]): Annotated sentence versions from each annotator.
-            common_sentence (str): The sentence from the merged document.
+            documents_sentences (List[List[str]]): The annotated sentences of each annotator document.
+            merged_sentences (List[str]): The sentences of the merged document.
             documents_tags (List[List[ITagModel]]): Per-document tag structures (with UUIDs).
             merged_tags (List[ITagModel]): Tag list from the merged document.
         """
-        tags_common_sentence = self._tag_processor.extract_tags_from_text(
-            common_sentence)
-        tags_sentences = [self._tag_processor.extract_tags_from_text(
-            sentence) for sentence in sentences]
+        documents_sentence_tags = [self._tag_processor.extract_tags_from_sentences(
+            document_sentences) for document_sentences in documents_sentences]
+        merged_sentence_tags = self._tag_processor.extract_tags_from_sentences(
+            merged_sentences)
+        documents_tags_by_id = [self._index_tags_by_id(document_tags)
+                                for document_tags in documents_tags + [merged_tags]]
+
+        for index, tags_common_sentence in enumerate(merged_sentence_tags):
+            self._find_equivalent_tags(
+                sentences=[document_sentences[index]
+                           for document_sentences in documents_sentences],
+                tags_sentences=[sentence_tags[index]
+                                for sentence_tags in documents_sentence_tags],
+                tags_common_sentence=tags_common_sentence,
+                documents_tags=documents_tags,
+                documents_tags_by_id=documents_tags_by_id)
+
+    def _find_equivalent_tags(
+        self,
+        sentences: List[str],
+        tags_sentences: List[List[Dict]],
+        tags_common_sentence: List[Dict],
+        documents_tags: List[List[ITagModel]],
+        documents_tags_by_id: List[Dict[str, ITagModel]]
+    ) -> None:
+        """
+        Marks equivalent tags based on the tag data already extracted from the sentence versions.
 
+        Args:
+            sentences (List[str]): Annotated sentence versions from each annotator.
+            tags_sentences (List[List[Dict]]): The tag data extracted from each annotator sentence.
+            tags_common_sentence (List[Dict]): The tag data extracted from the merged sentence.
+            documents_tags (List[List[ITagModel]]): Per-document tag structures (with UUIDs).
+            documents_tags_by_id (List[Dict[str, ITagModel]]): The tags of each annotator
+                document indexed by ID, followed by the tags of the merged document.
+        """
         if tags_common_sentence:
-            for index in range(len(tags_common_sentence)):
-                equivalent_uuids = []
-
-                # Collect UUIDs from document tag structures
-                all_tags = tags_sentences + [tags_common_sentence]
-                all_documents = documents_tags + [merged_tags]
+            all_tags = tags_sentences + [tags_common_sentence]
 
+            for index in range(len(tags_common_sentence)):
+                # Collect the TagModels of all versions from the document tag structures
+                equivalent_tags = []
                 for version_index, tags in enumerate(all_tags):
                     tag_id = tags[index]["attributes"]["id"]
-                    for tag in all_documents[version_index]:
-                        if tag.get_id() == tag_id:
-                            equivalent_uuids.append(tag.get_uuid())
-                            break
+                    tag = documents_tags_by_id[version_index].get(tag_id)
+                    if tag is not None:
+                        equivalent_tags.append(tag)
 
                 # Assign equivalent UUIDs to each TagModel
-                for version_index, tags in enumerate(all_tags):
-                    tag_id = tags[index]["attributes"]["id"]
-                    for tag in all_documents[version_index]:
-                        if tag.get_id() == tag_id:
-                            tag.set_equivalent_uuids(equivalent_uuids)
-                            break
+                equivalent_uuids = [tag.get_uuid() for tag in equivalent_tags]
+                for tag in equivalent_tags:
+                    tag.set_equivalent_uuids(equivalent_uuids)
             return
 
         # Hash signature → list of UUIDs
@@ -512,6 +613,10 @@ class TagManager:
 
         for annotator_index, tags in enumerate(tags_sentences):
             sentence = sentences[annotator_index]
+            document_tags_by_id = documents_tags_by_id[annotator_index]
+            # Positions of the tags in the sentence after stripping all tags
+            untagged_positions = self._tag_processor.get_untagged_tag_positions(
+                sentence)
             for tag in tags:
                 tag_type = tag["tag_type"]
                 tag_text = tag["text"]
@@ -519,31 +624,29 @@ class TagManager:
                               v in tag["attributes"].items() if k != "id"}
                 reference_keys = sorted(tag["attributes"].keys() - {"id"})
 
-                # Position relativ zum getaggten Satz
-                local_pos = tag["position"]
-                sentence_prefix = sentence[:local_pos]
-                relative_position = len(
-                    self._tag_processor.delete_all_tags_from_text(sentence_prefix))
+                # Position relativ zum getaggten Satz. The map holds every tag start, as
+                # both the map and the extracted tags come from the same scan of the sentence
+                relative_position = untagged_positions[tag["position"]]
 
-                signature_components = [
+                signature_components = (
                     tag_type,
                     tag_text,
                     str(sorted(attributes.items())),
                     str(reference_keys),
                     str(relative_position)
-                ]
-                signature_string = "|".join(signature_components)
-                positional_tag_hash = md5(
-                    signature_string.encode("utf-8")).hexdigest()
+                )
+                signature = blake2b(digest_size=16)
+                for component in signature_components:
+                    signature.update(component.encode("utf-8"))
+                    signature.update(b"|")
+                positional_tag_hash = signature.hexdigest()
 
                 # Find UUID from TagModel with same ID
-                tag_id = tag["attributes"]["id"]
-                for global_tag in documents_tags[annotator_index]:
-                    if global_tag.get_id() == tag_id:
-                        global_tag.set_positional_tag_hash(positional_tag_hash)
-                        equivalence_map.setdefault(
-                            positional_tag_hash, []).append(global_tag.get_uuid())
-                        break
+                global_tag = document_tags_by_id.get(tag["attributes"]["id"])
+                if global_tag is not None:
+                    global_tag.set_positional_tag_hash(positional_tag_hash)
+                    equivalence_map.setdefault(
+                        positional_tag_hash, []).append(global_tag.get_uuid())
 
         # Map back equivalent UUIDs to all TagModel objects
         for document_index, document in enumerate(documents_tags):
@@ -552,3 +655,20 @@ class TagManager:
                 if positional_tag_hash in equivalence_map:
                     tag.set_equivalent_uuids(
                         equivalence_map[positional_tag_hash])
+
+    def _index_tags_by_id(self, tags: List[ITagModel]) -> Dict[str, ITagModel]:
+        """
+        Builds a lookup table from tag IDs to tags.
+
+        If several tags share an ID, the first one in the list is kept.
+
+        Args:
+            tags (List[ITagModel]): The tags to index.
+
+        Returns:
+            Dict[str, ITagModel]: A dictionary mapping tag IDs to their tags.
+        """
+        tags_by_id = {}
+        for tag in tags:
+            tags_by_id.setdefault(tag.get_id(), tag)
+        return tags_by_id
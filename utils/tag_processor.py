@@ -5,6 +5,18 @@ from controller.interfaces import IController
 from model.interfaces import ITagModel
 from utils.interfaces import ITagProcessor
 
+# Matches a complete tag and captures its type, its raw attributes and its content.
+# The content runs up to the first closing tag of the same type, consuming
+# everything but "<" greedily instead of retrying a lazy match per character.
+_TAG_PATTERN = re.compile(
+    r'<(?P<tag_type>\w+)\s*(?P<attributes>[^>]*)>'
+    r'(?P<content>[^<]*(?:<(?!/\1>)[^<]*)*)</\1>'
+)
+# Matches a single key="value" attribute
+_ATTRIBUTE_PATTERN = re.compile(r'(?P<key>\w+)="(?P<value>[^"]*)"')
+# Finds the next XML-like tag at or after a given position
+_UPDATE_PATTERN = re.compile(r'<\w+\s*[^>]*>.*?</\w+>')
+
 
 class TagProcessor(ITagProcessor):
     """
@@ -38,7 +50,7 @@ class TagProcessor(ITagProcessor):
         tag_text = tag_model.get_text()
 
         # Validate if the text at the position matches the tag text
-        if text[position:position + len(tag_text)] != tag_text:
+        if not text.startswith(tag_text, position):
             raise ValueError(
                 f"Text at position {position} does not match the provided tag text.")
 
@@ -46,8 +58,8 @@ class TagProcessor(ITagProcessor):
         full_tag = str(tag_model)
 
         # Replace the original text with the tag at the specified position
-        updated_text = text[:position] + full_tag + \
-            text[position + len(tag_text):]
+        updated_text = "".join(
+            (text[:position], full_tag, text[position + len(tag_text):]))
 
         return updated_text
 
@@ -69,13 +81,13 @@ class TagProcessor(ITagProcessor):
         position = tag.get_position()
 
         # Validate if the tag exists at the expected position
-        if text[position:position + len(tag_str)] != tag_str:
+        if not text.startswith(tag_str, position):
             raise ValueError(
                 f"Tag not found at the specified position: {position}")
 
         # Remove the tag from the text
-        updated_text = text[:position] + \
-            tag.get_text() + text[position + len(tag_str):]
+        updated_text = "".join(
+            (text[:position], tag.get_text(), text[position + len(tag_str):]))
 
         return updated_text
 
@@ -96,24 +108,51 @@ class TagProcessor(ITagProcessor):
         Raises:
             ValueError: If no valid tag is found at the specified position.
         """
-        # Get the tag position in the text
-        position = tag.get_position()
+        return self.update_tags(text, [tag])
 
-        # Regex pattern to find an XML-like tag at the given position
-        pattern = r'<\w+\s*[^>]*>.*?</\w+>'
+    def update_tags(self, text: str, tags: List[ITagModel]) -> str:
+        """
+        Updates several tags in the text by replacing them with their new tag representations.
 
-        # Attempt to find a tag starting at or after the given position
-        match = re.search(pattern, text[position:])
-        if not match:
-            raise ValueError(
-                f"No valid tag found at the specified position {position}.")
+        The result equals calling `update_tag` for each tag in order, but the text is
+        rebuilt only once instead of once per tag.
 
-        # Replace the old tag with the new tag string representation
-        start_index = position + match.start(0)
-        end_index = position + match.end(0)
-        updated_text = text[:start_index] + str(tag) + text[end_index:]
+        Args:
+            text (str): The full document text containing the tags.
+            tags (List[ITagModel]): The updated tag instances, sorted by position. Each position
+                refers to the text after all preceding tags in the list have been updated.
 
-        return updated_text
+        Returns:
+            str: The updated text with the modified tags.
+
+        Raises:
+            ValueError: If no valid tag is found at the position of one of the tags.
+        """
+        if not tags:
+            # Nothing to replace, avoid copying the text
+            return text
+
+        pieces = []
+        last_end = 0  # End of the last replaced tag in the original text
+        shift = 0  # Length difference between the updated and the original text
+        for tag in tags:
+            position = tag.get_position()
+
+            # Attempt to find a tag starting at or after the given position
+            match = _UPDATE_PATTERN.search(text, max(position - shift, last_end))
+            if not match:
+                raise ValueError(
+                    f"No valid tag found at the specified position {position}.")
+
+            # Replace the old tag with the new tag string representation
+            tag_str = str(tag)
+            pieces.append(text[last_end:match.start()])
+            pieces.append(tag_str)
+            last_end = match.end()
+            shift += len(tag_str) - (match.end() - match.start())
+
+        pieces.append(text[last_end:])
+        return "".join(pieces)
 
     def extract_tags_from_text(self, text: str) -> List[Dict]:
         """
@@ -133,31 +172,31 @@ class TagProcessor(ITagProcessor):
                 - "position" (int): The starting position of the tag in the text.
                 - "text" (str): The content enclosed within the tag.
         """
-        tag_pattern = re.compile(
-            r'<(?P<tag_type>\w+)\s*(?P<attributes>[^>]*)>(?P<content>.*?)</\1>',
-            re.DOTALL
-        )
-        attribute_pattern = re.compile(r'(?P<key>\w+)="(?P<value>[^"]*)"')
+        # ID names and reference keys per tag type, queried once per type
+        tag_type_configurations = {}
 
         tags = []
-        for match in tag_pattern.finditer(text):
+        for match in _TAG_PATTERN.finditer(text):
             tag_type = match.group("tag_type")
             attributes_raw = match.group("attributes")
             content = match.group("content")
             start_position = match.start()
 
-            id_name = self._controller.get_id_name(tag_type)
+            if tag_type not in tag_type_configurations:
+                # Extract ID name and reference keys from controller
+                tag_type_configurations[tag_type] = (
+                    self._controller.get_id_name(tag_type),
+                    self._controller.get_id_refs(tag_type)
+                )
+            id_name, ref_keys = tag_type_configurations[tag_type]
             if not id_name:
                 #if a tag type found in the text is not defined in the current project configuration, skip it
                 continue
 
             # Parse attributes into a dictionary
-            attributes = dict(attribute_pattern.findall(attributes_raw))
+            attributes = dict(_ATTRIBUTE_PATTERN.findall(attributes_raw))
             attributes["id"] = attributes.pop(id_name)
 
-            # Extract reference keys from controller
-            ref_keys = self._controller.get_id_refs(tag_type)
-
             # Extract references from attributes
             references = {
                 key: value for key, value in attributes.items() if key in ref_keys
@@ -175,6 +214,22 @@ class TagProcessor(ITagProcessor):
             tags.append(tag_data)
         return tags
 
+    def extract_tags_from_sentences(self, sentences: List[str]) -> List[List[Dict]]:
+        """
+        Extracts the tags of several sentences.
+
+        Each sentence is scanned on its own, so a tag is only found if it is complete
+        within its sentence, and its position is relative to that sentence.
+
+        Args:
+            sentences (List[str]): The sentences containing tags.
+
+        Returns:
+            List[List[Dict]]: One list of tag dictionaries per sentence, in the format
+                returned by `extract_tags_from_text`.
+        """
+        return [self.extract_tags_from_text(sentence) for sentence in sentences]
+
     def delete_all_tags_from_text(self, text: str) -> str:
         """
         Removes all tags from the given text, replacing them with their enclosed content.
@@ -188,12 +243,30 @@ class TagProcessor(ITagProcessor):
         Returns:
             str: The text with all tags removed, keeping only the inner content.
         """
-        tag_pattern = re.compile(
-            r'<(?P<tag_type>\w+)\s*(?P<attributes>[^>]*)>(?P<content>.*?)</\1>',
-            re.DOTALL
-        )
+        return _TAG_PATTERN.sub(lambda match: match.group("content"), text)
+
+    def get_untagged_tag_positions(self, text: str) -> Dict[int, int]:
+        """
+        Maps the start position of each tag in the text to its position in the untagged text.
 
-        return re.sub(tag_pattern, lambda match: match.group("content"), text)
+        The untagged position of a tag equals the length of the text preceding the tag
+        after all tags have been removed from it, as done by `delete_all_tags_from_text`.
+        All positions are computed in a single scan over the text.
+
+        Args:
+            text (str): The input text containing tags.
+
+        Returns:
+            Dict[int, int]: A dictionary mapping the start position of each tag in the text
+                to the corresponding position in the untagged text.
+        """
+        untagged_positions = {}
+        removed_length = 0
+        for match in _TAG_PATTERN.finditer(text):
+            start_position = match.start()
+            untagged_positions[start_position] = start_position - removed_length
+            removed_length += len(match.group(0)) - len(match.group("content"))
+        return untagged_positions
 
     def remove_ids_from_tags(self, text: str) -> str:
         """
@@ -205,12 +278,8 @@ class TagProcessor(ITagProcessor):
         Returns:
             str: The text with the tags where ID and IDREF attributes have been removed.
         """
-        # Regex pattern to extract tag type, attributes, and content
-        tag_pattern = re.compile(
-            r'<(?P<tag_type>\w+)\s*(?P<attributes>[^>]*)>(?P<content>.*?)</\1>',
-            re.DOTALL
-        )
-        attribute_pattern = re.compile(r'(?P<key>\w+)="(?P<value>[^"]*)"')
+        # Attribute names to be removed per tag type, queried once per type
+        idrefs_by_tag_type = {}
 
         # Process each tag match
         def clean_tag(match):
@@ -219,12 +288,15 @@ class TagProcessor(ITagProcessor):
             content = match.group("content")
 
             # Retrieve the attribute names to be removed
-            idrefs = self._controller.get_id_refs(tag_type)
+            idrefs = idrefs_by_tag_type.get(tag_type)
+            if idrefs is None:
+                idrefs = idrefs_by_tag_type[tag_type] = frozenset(
+                    self._controller.get_id_refs(tag_type))
 
             # Parse attributes and remove ID and IDREF attributes
-            attributes = attribute_pattern.findall(attributes_raw)
             cleaned_attributes = [
-                f'{key}="{value}"' for key, value in attributes if key not in idrefs
+                f'{key}="{value}"' for key, value in _ATTRIBUTE_PATTERN.findall(attributes_raw)
+                if key not in idrefs
             ]
 
             # Construct the cleaned tag
@@ -233,7 +305,7 @@ class TagProcessor(ITagProcessor):
             return cleaned_tag
 
         # Substitute tags in the text with cleaned versions
-        cleaned_text = tag_pattern.sub(clean_tag, text)
+        cleaned_text = _TAG_PATTERN.sub(clean_tag, text)
 
         return cleaned_text
 
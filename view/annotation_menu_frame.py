@@ -44,6 +44,13 @@ class AnnotationMenuFrame(tk.Frame, IAnnotationMenuFrame):
         self._layout_rendered = False
         self._observers_registered = False
 
+        # State changes collected until the next idle cycle applies them
+        self._pending_state: Dict = {}
+        self._update_job = None
+
+        # Scheduled scrollregion updates keyed by the canvas they belong to
+        self._scrollregion_jobs: Dict[tk.Canvas, str] = {}
+
     def _render(self) -> None:
         """
         Renders pages in the notebook for each template group.
@@ -79,14 +86,10 @@ class AnnotationMenuFrame(tk.Frame, IAnnotationMenuFrame):
 
         scrollable_frame.bind(
             "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+            lambda e: self._schedule_scrollregion_update(canvas)
         )
 
-        canvas.bind(
-            "<Configure>",
-            lambda e: canvas.itemconfig(
-                "scrollable_window", width=canvas.winfo_width())
-        )
+        canvas.bind("<Configure>", self._on_canvas_configure)
 
         canvas.create_window((0, 0), window=scrollable_frame,
                              anchor="nw", tags="scrollable_window")
@@ -111,6 +114,39 @@ class AnnotationMenuFrame(tk.Frame, IAnnotationMenuFrame):
 
         return container_frame
 
+    def _schedule_scrollregion_update(self, canvas: tk.Canvas) -> None:
+        """
+        Schedules an update of the scrollregion of the given canvas for the next idle cycle.
+
+        The scrollable frame reports a geometry change for every tag frame packed into it.
+        Deferring the update recomputes the bounding box once instead of once per change.
+
+        Args:
+            canvas (tk.Canvas): The canvas whose scrollregion has to be updated.
+        """
+        if canvas not in self._scrollregion_jobs:
+            self._scrollregion_jobs[canvas] = self.after_idle(
+                self._update_scrollregion, canvas)
+
+    def _update_scrollregion(self, canvas: tk.Canvas) -> None:
+        """
+        Sets the scrollregion of the given canvas to the bounding box of its content.
+
+        Args:
+            canvas (tk.Canvas): The canvas whose scrollregion has to be updated.
+        """
+        del self._scrollregion_jobs[canvas]
+        canvas.configure(scrollregion=canvas.bbox("all"))
+
+    def _on_canvas_configure(self, event: tk.Event) -> None:
+        """
+        Stretches the scrollable frame to the new width of its canvas.
+
+        Args:
+            event (tk.Event): The configure event of the canvas.
+        """
+        event.widget.itemconfig("scrollable_window", width=event.width)
+
     def _ensure_layout(self) -> None:
         """
         Ensures that the layout is rendered once template groups are available.
@@ -123,13 +159,29 @@ class AnnotationMenuFrame(tk.Frame, IAnnotationMenuFrame):
         """
         Updates the observer based on the state changes from the given publisher.
 
-        This method retrieves the updated state from the controller and processes both 
-        data-related and layout-related changes in a unified way.
+        This method retrieves the updated state from the controller and schedules it
+        to be applied once the event loop is idle. Updates arriving in the meantime
+        are merged, so a burst of notifications updates the widgets only once.
 
         Args:
             publisher (IPublisher): The publisher that triggered the update.
         """
-        state = self._controller.get_observer_state(self, publisher)
+        self._pending_state.update(
+            self._controller.get_observer_state(self, publisher))
+
+        if self._update_job is None:
+            self._update_job = self.after_idle(self._apply_pending_state)
+
+    def _apply_pending_state(self) -> None:
+        """
+        Applies the state changes collected since the last idle cycle.
+
+        Both data-related and layout-related changes are processed in a unified way.
+        For each state key, only the most recent value is applied.
+        """
+        state = self._pending_state
+        self._pending_state = {}
+        self._update_job = None
 
         if "template_groups" in state:
             self._template_groups = state["template_groups"]
@@ -148,10 +200,14 @@ class AnnotationMenuFrame(tk.Frame, IAnnotationMenuFrame):
                 tag_frame.set_attributes(suggestions)
 
         if "tags" in state:
+            # Collect the IDs of all tag types in a single pass over the tags
+            idref_lists = {tag_type: [""] for tag_type in self._tag_frames}
+            for tag in state["tags"]:
+                idref_list = idref_lists.get(tag.get_tag_type())
+                if idref_list is not None:
+                    idref_list.append(tag.get_id())
             for tag_type, tag_frame in self._tag_frames.items():
-                idref_list = [""] + [tag.get_id() for tag in state["tags"]
-                                     if tag.get_tag_type() == tag_type]
-                tag_frame.set_idref_list(idref_list)
+                tag_frame.set_idref_list(idref_lists[tag_type])
 
         if "current_search_result" in state:
             current_search_result = state["current_search_result"]
@@ -168,6 +224,22 @@ class AnnotationMenuFrame(tk.Frame, IAnnotationMenuFrame):
                     raise ValueError(
                         f"Tag type '{tag_type}' not found in tag frames.")
 
+    def destroy(self) -> None:
+        """
+        Cancels the scheduled state and scrollregion updates before destroying the frame.
+
+        Destroying the frame deletes the Tcl commands of the idle callbacks, so a
+        pending update would otherwise fail once the event loop is idle.
+        """
+        if self._update_job is not None:
+            self.after_cancel(self._update_job)
+            self._update_job = None
+        self._pending_state = {}
+        for scrollregion_job in self._scrollregion_jobs.values():
+            self.after_cancel(scrollregion_job)
+        self._scrollregion_jobs.clear()
+        super().destroy()
+
     def finalize_view(self) -> None:
         """
         Retrieves the layout state and triggers the initial layout rendering.
@@ -6,6 +6,9 @@ from controller.interfaces import IController
 from data_classes.search_result import SearchResult
 from view.tooltip import ToolTip
 
+# Attribute types that are edited in a plain entry widget
+_ENTRY_TYPES = frozenset({"CDATA", "ID", "UNION"})
+
 
 class AnnotationTagFrame(tk.Frame):
     """
@@ -36,11 +39,13 @@ class AnnotationTagFrame(tk.Frame):
         # dict of attribute widgets to chose references to other tags
         self._idref_attributes = {}
         self._selected_text_entry = None  # Entry for selected text
+        self._selected_text = ""  # Text currently shown in the selected text entry
         self._output_widget = None
         self._display_widget = None
         self._current_search_result: SearchResult = None
         self._db_id = None  # to identify for which db search this tag frame is used
         self._tooltips = []
+        self._idrefs = ()  # ID references currently offered by the idref widgets
         self._render()
         if self._display_widget:
             self._display_widget.bind(
@@ -150,7 +155,7 @@ class AnnotationTagFrame(tk.Frame):
 
             attribute_type = attribute_data["type"].upper()
 
-            if attribute_type in ["CDATA", "ID", "UNION"]:
+            if attribute_type in _ENTRY_TYPES:
                 widget = tk.Entry(self)
             elif attribute_type == "OUTPUT":
                 widget = tk.Entry(self, state="disabled")
@@ -220,6 +225,10 @@ class AnnotationTagFrame(tk.Frame):
         """
         if len(text) > 50:
             text = text[:50]+"..."
+        if text == self._selected_text:
+            return  # The entry is read-only, so it still shows this text
+        self._selected_text = text
+
         self._selected_text_entry.config(state="normal")
         self._selected_text_entry.delete(0, tk.END)
         self._selected_text_entry.insert(0, text)
@@ -276,17 +285,18 @@ class AnnotationTagFrame(tk.Frame):
         if not selected_text:
             raise ValueError("No text is currently selected.")
 
-        # Collect tag attributes from widgets
-        attributes = {
-            attribute_name: widget.get().strip()
-            for attribute_name, widget in self._data_widgets.items()
-            if widget.get().strip()
-        }
+        # Collect tag attributes from widgets, reading each widget once
+        attributes = {}
+        for attribute_name, widget in self._data_widgets.items():
+            value = widget.get().strip()
+            if value:
+                attributes[attribute_name] = value
 
+        # IDREF widgets are data widgets as well, so their values are already known
         references = {
-            attribute_name: widget.get().strip()
-            for attribute_name, widget in self._idref_attributes.items()
-            if widget.get().strip()
+            attribute_name: attributes[attribute_name]
+            for attribute_name in self._idref_attributes
+            if attribute_name in attributes
         }
 
         # Build the tag data dictionary
@@ -320,16 +330,20 @@ class AnnotationTagFrame(tk.Frame):
         with the provided values. It ensures that each attribute is displayed
         correctly in the UI.
 
+        Attributes missing from the data are cleared. Widgets that already show
+        the requested value are left untouched.
+
         Args:
             attribute_data (Dict[str, str]): A dictionary where keys are attribute names 
                                              and values are their corresponding values to be set.
         """
-        for widget in self._data_widgets.values():
+        for attribute_name, widget in self._data_widgets.items():
+            attribute_value = attribute_data.get(attribute_name, "")
+            # Compare against the widget itself, as the user may have edited it
+            if widget.get() == attribute_value:
+                continue
             widget.delete(0, tk.END)
-
-        for attribute_name, attribute_value in attribute_data.items():
-            widget = self._data_widgets.get(attribute_name, None)
-            if widget:
+            if attribute_value:
                 widget.insert(0, attribute_value)
 
     def set_search_result(self, search_result: SearchResult) -> None:
@@ -385,9 +399,16 @@ class AnnotationTagFrame(tk.Frame):
         for all stored ID reference widgets, ensuring that they display the correct 
         choices based on the current application state.
 
+        The widgets are only reconfigured if the list differs from the one set last.
+
         Args:
             idrefs (List[str]): A list of available ID references to populate the widgets.
         """
+        idrefs = tuple(idrefs)
+        if idrefs == self._idrefs:
+            return
+        self._idrefs = idrefs
+
         for widget in self._idref_widgets:
             widget.config(values=idrefs)
 
@@ -1,4 +1,5 @@
-from typing import List, Tuple
+from bisect import bisect_right
+from typing import List, Set, Tuple
 from controller.interfaces import IController
 from model.highlight_model import HighlightModel
 from observer.interfaces import IPublisher
@@ -12,6 +13,8 @@ class AnnotationTextDisplayFrame(TextDisplayFrame):
     """
 
     def __init__(self, parent: tk.Widget, controller: IController, is_static_observer: bool = False, height: int = None) -> None:
+        # Highlight tags that currently have ranges in the text widget
+        self._active_highlight_tags: Set[str] = set()
         super().__init__(parent=parent, controller=controller,
                          editable=False, is_static_observer=is_static_observer, height=height)
 
@@ -28,12 +31,42 @@ class AnnotationTextDisplayFrame(TextDisplayFrame):
                 self, publisher)
 
             self.unhighlight_text()
+            line_starts = self._get_line_starts()
             self._apply_highlights(
-                highlight_data.get("tag_highlight_data", []), prefix="tag")
+                highlight_data.get("tag_highlight_data", []), prefix="tag", line_starts=line_starts)
             self._apply_highlights(
-                highlight_data.get("search_highlight_data", []), prefix="search")
+                highlight_data.get("search_highlight_data", []), prefix="search", line_starts=line_starts)
 
-    def _apply_highlights(self, highlight_data: List[Tuple[str, int, int]], prefix: str) -> None:
+    def _get_line_starts(self) -> List[int]:
+        """
+        Computes the character offset at which each line of the displayed text starts.
+
+        Returns:
+            List[int]: The offsets of the line starts, beginning with 0 for the first line.
+        """
+        line_starts = [0]
+        for line in self.text_widget.get("1.0", "end-1c").split("\n")[:-1]:
+            line_starts.append(line_starts[-1] + len(line) + 1)
+        return line_starts
+
+    def _to_text_index(self, offset: int, line_starts: List[int]) -> str:
+        """
+        Converts a character offset into a "line.column" index of the text widget.
+
+        Unlike an index of the form "1.0+<offset>c", Tk does not need to count the
+        characters from the start of the text to resolve it.
+
+        Args:
+            offset (int): The character offset in the displayed text.
+            line_starts (List[int]): The line start offsets as returned by `_get_line_starts`.
+
+        Returns:
+            str: The corresponding text widget index.
+        """
+        line = bisect_right(line_starts, offset)
+        return f"{line}.{offset - line_starts[line - 1]}"
+
+    def _apply_highlights(self, highlight_data: List[Tuple[str, int, int]], prefix: str, line_starts: List[int]) -> None:
         """
         Applies text highlighting based on the provided highlight data.
 
@@ -43,14 +76,25 @@ class AnnotationTextDisplayFrame(TextDisplayFrame):
                 - int: The start position of the highlight in the text.
                 - int: The end position of the highlight in the text.
             prefix (str): A prefix to differentiate highlight types (e.g., "tag" or "search").
+            line_starts (List[int]): The line start offsets of the displayed text.
         """
+        # Collect the ranges per highlight tag, so each tag is configured and added in one call.
+        # Every tag is raised or lowered below, which overrides its creation order. Applied per
+        # range, the last raise or lower of a tag decides its priority, so a tag is moved to the
+        # end whenever it reoccurs. This holds for tag_lower as much as for tag_raise.
+        highlight_tags = {}
         for (bg_color, font_color, start, end) in highlight_data:
             tag_name = f"highlight_{prefix}_{bg_color}"
-            self.text_widget.tag_configure(
-                tag_name, background=bg_color, foreground=font_color)
-            start_index = f"1.0+{start}c"
-            end_index = f"1.0+{end}c"
-            self.text_widget.tag_add(tag_name, start_index, end_index)
+            _, indices = highlight_tags.pop(tag_name, (None, []))
+            indices.extend((self._to_text_index(start, line_starts),
+                            self._to_text_index(end, line_starts)))
+            highlight_tags[tag_name] = (
+                {"background": bg_color, "foreground": font_color}, indices)
+
+        for tag_name, (colors, indices) in highlight_tags.items():
+            self.text_widget.tag_configure(tag_name, **colors)
+            self.text_widget.tag_add(tag_name, *indices)
+            self._active_highlight_tags.add(tag_name)
             # Priority: search_highlights über tag_highlights
             if prefix == "search":
                 self.text_widget.tag_raise(tag_name)
@@ -61,8 +105,8 @@ class AnnotationTextDisplayFrame(TextDisplayFrame):
         """
         Removes all existing text highlights.
 
-        This method iterates through all existing highlight tags and removes them from the text widget.
+        Only the highlight tags applied since the last call are removed from the text widget.
         """
-        for tag in self.text_widget.tag_names():
-            if tag.startswith("highlight_"):
-                self.text_widget.tag_remove(tag, "1.0", "end")
+        for tag in self._active_highlight_tags:
+            self.text_widget.tag_remove(tag, "1.0", "end")
+        self._active_highlight_tags.clear()